@@ -1,13 +1,50 @@
 from django.core.exceptions import ImproperlyConfigured
-from pydantic import BaseModel
+from functools import lru_cache
+from typing import Dict, Mapping
 
-class DjaggerConfig(BaseModel):
+class DjaggerConfig:
     """Djagger configuration schema"""
-    global_prefix = ""
 
-try:
-    from django.conf import settings
-    djagger_config = DjaggerConfig.parse_obj(settings.DJAGGER_CONFIG)
+    __slots__ = ("global_prefix", "silence_unknown_kwargs")
 
-except (ImproperlyConfigured, AttributeError):
-    djagger_config = DjaggerConfig()
\ No newline at end of file
+    def __init__(self, global_prefix: str = "", silence_unknown_kwargs: bool = False):
+        # Values are checked rather than coerced so that e.g. ``None`` or ``"false"`` are rejected
+        if not isinstance(global_prefix, str):
+            raise TypeError(
+                f"DJAGGER_CONFIG global_prefix must be a string. Got {type(global_prefix)}"
+            )
+        if not isinstance(silence_unknown_kwargs, bool):
+            raise TypeError(
+                f"DJAGGER_CONFIG silence_unknown_kwargs must be a bool. Got {type(silence_unknown_kwargs)}"
+            )
+        self.global_prefix = global_prefix
+        self.silence_unknown_kwargs = silence_unknown_kwargs
+
+    @classmethod
+    def parse_obj(cls, obj: Dict) -> "DjaggerConfig":
+        """Initializes the config from the ``DJAGGER_CONFIG`` dict, ignoring unknown keys"""
+        if not isinstance(obj, Mapping):
+            raise TypeError(f"DJAGGER_CONFIG must be a dict. Got {type(obj)}")
+        return cls(**{k: v for k, v in obj.items() if k in cls.__slots__})
+
+
+@lru_cache(maxsize=1)
+def get_djagger_config() -> DjaggerConfig:
+    """Returns the validated ``DJAGGER_CONFIG`` settings. The result is cached so that
+    repeated callers share a single instance. After ``get_djagger_config.cache_clear()``
+    the next call parses the settings again, which only refreshes values read through this
+    function i.e. ``silence_unknown_kwargs``. ``global_prefix`` is read once at import by the
+    module-level ``djagger_config`` and ``ViewAttributes`` and is not refreshed.
+    """
+    try:
+        from django.conf import settings
+        config = settings.DJAGGER_CONFIG
+
+    except (ImproperlyConfigured, AttributeError):
+        # Settings are not configured or ``DJAGGER_CONFIG`` is not set
+        return DjaggerConfig()
+
+    return DjaggerConfig.parse_obj(config)
+
+
+djagger_config = get_djagger_config()
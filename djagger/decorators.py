@@ -3,9 +3,13 @@ Decorators
 ==========
 """
 from typing import List
+from types import FunctionType
 from .enums import HttpMethod, ViewAttributes, DJAGGER_HTTP_METHODS
+from .config import get_djagger_config
 import warnings
 
+_HTTP_METHOD_VALUES = frozenset(HttpMethod.values())
+
 
 def schema(methods: List[str], **attrs):
     """Decorator for function based views to set Djagger attributes into the view.
@@ -27,21 +31,30 @@ def schema(methods: List[str], **attrs):
 
     def decorator(f):
 
-        for k, v in attrs.items():
-            if k not in ViewAttributes.attr_list:
-                warnings.warn(f"schema decorator got an unexpected keyword {k}")
-                continue
-            setattr(f, k, v)
+        attr_list = ViewAttributes.attr_list
+        payload = {k: v for k, v in attrs.items() if k in attr_list}
+
+        if len(payload) != len(attrs) and not get_djagger_config().silence_unknown_kwargs:
+            unknown = [k for k in attrs if k not in attr_list]
+            warnings.warn(f"schema decorator got unexpected keywords {unknown}")
 
         # Validate http method strings
         for method in methods:
-            try:
-                HttpMethod(method.lower())
-            except ValueError:
+            # Skip lowercasing when the method string is already a canonical http method
+            if method in _HTTP_METHOD_VALUES:
+                continue
+            if method.lower() not in _HTTP_METHOD_VALUES:
                 raise ValueError(f"methods must be a list of string http methods e.g., {HttpMethod.values()}")
         
-        # Save the http methods used in the fbv as an attribute
-        setattr(f, DJAGGER_HTTP_METHODS, methods)
+        # Save the djagger attributes and the http methods used in the fbv as attributes
+        payload[DJAGGER_HTTP_METHODS] = methods
+        if type(f) is FunctionType:
+            # Plain functions take all attributes in a single update of their ``__dict__``
+            f.__dict__.update(payload)
+        else:
+            # e.g. classes, whose ``__dict__`` is a read-only mappingproxy
+            for k, v in payload.items():
+                setattr(f, k, v)
 
         return f
 
@@ -2,16 +2,29 @@
 Enums
 =====
 """
-from typing import Union, List, Any, Type, Callable, Optional
+from typing import Union, List, Any, Type, Callable, Optional, Dict, Tuple
 from enum import Enum
+from functools import lru_cache
+from itertools import chain
+import sys
 from .config import djagger_config
 
+_MISSING = object()  # Sentinel for attributes that are not set on a view
+
 DJAGGER_HTTP_METHODS = (
     "djagger_http_methods"  # FBV attribute name for http methods used in the FBV
 )
 
 
-class HttpMethod(str, Enum):
+if sys.version_info >= (3, 11):
+    from enum import StrEnum as _StrEnum
+else:
+
+    class _StrEnum(str, Enum):  # type: ignore
+        """Fallback string Enum base for Python versions without ``enum.StrEnum``"""
+
+
+class HttpMethod(_StrEnum):
     GET = "get"
     POST = "post"
     PATCH = "patch"
@@ -22,9 +35,10 @@ class HttpMethod(str, Enum):
     TRACE = "trace"
 
     @classmethod
-    def values(cls):
-        """Returns list of http method strings [ 'get', 'post', ... ]"""
-        return [member.value for member in cls.__members__.values()]
+    @lru_cache(maxsize=None)
+    def values(cls) -> Tuple[str, ...]:
+        """Returns tuple of http method strings ( 'get', 'post', ... )"""
+        return tuple(member.value for member in cls.__members__.values())
 
 
 class ParameterLocation(str, Enum):
@@ -36,36 +50,68 @@ class ParameterLocation(str, Enum):
     BODY = "body"
 
 
+# Mapping of parameter attribute enum names to their 'in' location value
+PARAMETER_LOCATION_MAP = {
+    "PATH_PARAMS": ParameterLocation.PATH.value,
+    "QUERY_PARAMS": ParameterLocation.QUERY.value,
+    "HEADER_PARAMS": ParameterLocation.HEADER.value,
+    "COOKIE_PARAMS": ParameterLocation.COOKIE.value,
+    "BODY_PARAMS": ParameterLocation.BODY.value,
+}
+
+
 class DjaggerAttributeEnumType(str, Enum):
 
     """Enum type with helper class methods to initialize View-level and operation-level djagger view attributes as enums"""
 
     @classmethod
-    def items(cls):
-        """List of tuples of the enum attr names and the corresponding value"""
-        return [(k, v.value) for k, v in cls.__members__.items()]
+    @lru_cache(maxsize=None)
+    def items(cls) -> Tuple[Tuple[str, str], ...]:
+        """Tuple of tuples of the enum attr names and the corresponding value"""
+        return tuple((k, v.value) for k, v in cls.__members__.items())
 
     @classmethod
-    def values(cls):
-        """List of enum attr string values"""
-        return [m.value for m in cls.__members__.values()]
+    @lru_cache(maxsize=None)
+    def values(cls) -> Tuple[str, ...]:
+        """Tuple of enum attr string values"""
+        return tuple(m.value for m in cls.__members__.values())
 
     def location(self) -> Optional[str]:
         """Returns the 'in' location value for parameters"""
-        location_map = {
-            "PATH_PARAMS": ParameterLocation.PATH.value,
-            "QUERY_PARAMS": ParameterLocation.QUERY.value,
-            "HEADER_PARAMS": ParameterLocation.HEADER.value,
-            "COOKIE_PARAMS": ParameterLocation.COOKIE.value,
-            "BODY_PARAMS": ParameterLocation.BODY.value,
-        }
+        # ``_name_`` is read directly to skip the Enum ``name`` property
+        return PARAMETER_LOCATION_MAP.get(self._name_, None)
+
+
+# Cache of generated attribute Enum classes keyed by enum name and its (name, value) pairs
+_ENUM_CACHE: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Any] = {}
 
-        return location_map.get(self.name, None)
+
+def attribute_enum_factory(name: str, attrs: Tuple[Tuple[str, str], ...]) -> Any:
+    """Creates a ``DjaggerAttributeEnumType`` Enum class named ``name`` with members from the ``attrs``
+    tuple of (name, value) pairs. Repeated calls with the same definition return the same Enum class.
+    """
+    key = (name, attrs)
+    enum_cls = _ENUM_CACHE.get(key)
+    if enum_cls is None:
+        enum_cls = DjaggerAttributeEnumType(name, attrs)  # type: ignore
+        _ENUM_CACHE[key] = enum_cls
+    return enum_cls
 
 
 class DjaggerViewAttributes:
     """Contains enums for djagger attributes that can be extracted from a view class of function"""
 
+    # Operation-level attribute enums are stored in slots named after each http method e.g. ``get``
+    __slots__ = (
+        "custom_prefix",
+        "http_methods",
+        "api",
+        "attr_list",
+        "_operations",
+        "_prefixed",
+        *HttpMethod.values(),
+    )
+
     # Mapping of enums to djagger attrs that may be found in a view
     view_attrs = {
         "PATH_PARAMS": "path_params",
@@ -94,9 +140,9 @@ class DjaggerViewAttributes:
             'get_summary'
         """
 
-        attr_name = self.api(attr).name
-        operation_attr_enum = getattr(self, http_method.value)
-        operation_attr_value = getattr(operation_attr_enum, attr_name)
+        operation_attr_value = self._prefixed[http_method].get(attr)
+        if operation_attr_value is None:
+            raise ValueError(f"{attr!r} is not a valid djagger attribute")
 
         return operation_attr_value
 
@@ -119,25 +165,32 @@ class DjaggerViewAttributes:
 
         """
 
-        value = None
+        operation_attr_value = None
 
         if http_method:
-            operation_attr_value = self.retrieve_operation_attr_value(attr, http_method)
-            value = getattr(view, operation_attr_value, getattr(view, attr, None))
-        else:
-            value = getattr(view, attr, None)
+            # Unknown attributes fall through to retrieve_operation_attr_value() which raises
+            operation_attr_value = self._prefixed[http_method].get(
+                attr
+            ) or self.retrieve_operation_attr_value(attr, http_method)
 
         # If failed to extract any value from FBV, look for parent class and attempt to extract
         # from parent class 'cls' attributes if parent class exists
 
-        if value == None and hasattr(view, "cls"):
-            return self.from_view(view.cls, attr=attr, http_method=http_method)  # type: ignore
+        while view is not None:
+            value = _MISSING
+            if operation_attr_value:
+                value = getattr(view, operation_attr_value, _MISSING)
+            if value is _MISSING:
+                value = getattr(view, attr, None)
+            if value is not None:
+                return value
+            view = getattr(view, "cls", None)
 
-        return value
+        return None
 
     def operation(self, http_method: HttpMethod) -> DjaggerAttributeEnumType:
         """Returns the DjaggerAttributeEnumType value for the corresponding HttpMethod"""
-        op = getattr(self, http_method.value, None)
+        op = self._operations.get(http_method)
         if not op:
             raise AttributeError(
                 f"Http method {http_method.value} not found as a callable method"
@@ -145,36 +198,57 @@ class DjaggerViewAttributes:
         return op
 
     @classmethod
-    def prefix_attrs(cls, method_prefix: str, custom_prefix: str = ""):
-        """Prefixes view_attrs values with string prefix e.g. ``get_`` in 'get_operation_id'"""
-        return {
-            k: f"{custom_prefix}{method_prefix}_{v}" for k, v in cls.view_attrs.items()
-        }
+    @lru_cache(maxsize=None)
+    def prefix_attrs(
+        cls, method_prefix: str, custom_prefix: str = ""
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Prefixes view_attrs values with string prefix e.g. ``get_`` in 'get_operation_id'.
+        Returns a tuple of (name, value) pairs.
+        """
+        return tuple(
+            (k, sys.intern(f"{custom_prefix}{method_prefix}_{v}"))
+            for k, v in cls.view_attrs.items()
+        )
 
     def __init__(self, custom_prefix: str, *http_methods):
 
         # Handle custom view_attrs for case where custom_prefix provided
-        view_attrs = {k: f"{custom_prefix}{v}" for k, v in self.view_attrs.items()}
+        # Attribute names are interned as they are repeatedly used for getattr on views
+        view_attrs = tuple(
+            (k, sys.intern(f"{custom_prefix}{v}")) for k, v in self.view_attrs.items()
+        )
 
         self.custom_prefix = custom_prefix
         self.http_methods = http_methods
-        self.api = DjaggerAttributeEnumType(  # type: ignore
+        self.api = attribute_enum_factory(
             "api", view_attrs
         )  # API-level attribute Enum e.g. 'body_params'
-        self.attr_list = self.api.values()
+
+        # Mapping of http method string to its operation-level attribute Enum
+        self._operations: Dict[str, DjaggerAttributeEnumType] = {}
+        # Mapping of http method string to API-level -> operation-level attribute values
+        # e.g. { 'get': { 'summary': 'get_summary', ... } }
+        self._prefixed: Dict[str, Dict[str, str]] = {}
+
+        api_values = tuple(v for _, v in view_attrs)
+        attr_list_parts = [api_values]
 
         for http_method in http_methods:
-            # Create operation-level attribute Enum for each operation e.g. 'get_body_params'
-            setattr(
-                self,
-                http_method,
-                DjaggerAttributeEnumType(
-                    http_method,
-                    self.prefix_attrs(
-                        method_prefix=http_method, custom_prefix=self.custom_prefix
-                    ),
-                ),
+            operation_attrs = self.prefix_attrs(
+                method_prefix=http_method, custom_prefix=self.custom_prefix
             )
-            self.attr_list += getattr(self, http_method).values()
+            # Create operation-level attribute Enum for each operation e.g. 'get_body_params'
+            operation_enum = attribute_enum_factory(http_method, operation_attrs)
+            if http_method in HttpMethod.values():
+                setattr(self, http_method, operation_enum)
+            self._operations[http_method] = operation_enum
+
+            # view_attrs and operation_attrs share the same key order
+            operation_values = tuple(v for _, v in operation_attrs)
+            self._prefixed[http_method] = dict(zip(api_values, operation_values))
+            attr_list_parts.append(operation_values)
+
+        # Frozen set of all API-level and operation-level attribute names for fast membership checks
+        self.attr_list = frozenset(chain.from_iterable(attr_list_parts))
 
 ViewAttributes = DjaggerViewAttributes(djagger_config.global_prefix, *HttpMethod.values())
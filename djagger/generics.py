@@ -3,6 +3,8 @@
 from rest_framework.serializers import SerializerMetaclass, ListSerializer
 from .enums import ViewAttributes
 
+_RESPONSE_SCHEMA_ATTR: str = ViewAttributes.api.RESPONSE_SCHEMA.value
+
 
 def set_response_schema_from_serializer_class(view):
     """Given a View, set ``response_schema`` if it has not been set to the value in ``serializer_class``
@@ -11,15 +13,14 @@ def set_response_schema_from_serializer_class(view):
     This is to give ``GenericAPIView`` views a default response schema by using the ``serializer_class``.
     """
 
-    if not hasattr(view, "serializer_class"):
-        return
+    serializer_class = getattr(view, "serializer_class", None)
 
-    if not isinstance(view.serializer_class, (SerializerMetaclass, ListSerializer)):
+    if not isinstance(serializer_class, (SerializerMetaclass, ListSerializer)):
         return
 
-    if hasattr(view, ViewAttributes.api.RESPONSE_SCHEMA):
+    if hasattr(view, _RESPONSE_SCHEMA_ATTR):
         # skip if response_schema was already set
         return
 
-    view.response_schema = view.serializer_class
+    setattr(view, _RESPONSE_SCHEMA_ATTR, serializer_class)
     return
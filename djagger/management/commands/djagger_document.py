@@ -1,9 +1,10 @@
 """Custom manage.py command for generating schema json file"""
 
 from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
 from django.conf import settings
+from ... import openapi
 from ...openapi import Document
-
 import json
 
 
@@ -18,7 +19,14 @@ class Command(BaseCommand):
 
         fname = options["fname"]
         doc_settings = getattr(settings, "DJAGGER_DOCUMENT", {})
+
+        if openapi.orjson is not None:
+            with open(fname, "wb") as f:
+                f.write(Document.generate_json(**doc_settings))
+            return
+
+        # Without orjson, stream the document to file rather than building the whole JSON string in memory
         document = Document.generate(**doc_settings)
 
         with open(fname, "w") as f:
-            f.write(json.dumps(document))
+            json.dump(document, f, cls=DjangoJSONEncoder)
@@ -7,9 +7,15 @@ For official specs, see https://swagger.io/specification/
 from pydantic import BaseModel, Field, ValidationError
 from pydantic.main import ModelMetaclass
 from rest_framework import serializers
-from typing import Optional, List, Dict, Union, Type, Any, cast
+from django.core.serializers.json import DjangoJSONEncoder
+from typing import Optional, List, Dict, Union, Type, Any, Tuple, Iterator, cast
 from .serializers import SerializerConverter
-from .utils import schema_set_examples, get_url_patterns, model_field_schemas
+from .utils import (
+    schema_set_examples,
+    get_url_patterns,
+    model_field_schemas,
+    model_to_dict,
+)
 from .generics import set_response_schema_from_serializer_class
 from .enums import (
     HttpMethod,
@@ -19,25 +25,68 @@ from .enums import (
     DJAGGER_HTTP_METHODS,
 )
 from enum import Enum
-import uuid
-import inspect
+from types import FunctionType
+from functools import lru_cache
 import warnings
 import copy
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+HTTP_METHODS = tuple(HttpMethod)  # All HttpMethod members in definition order
+HTTP_METHOD_NAMES = tuple(m.value for m in HTTP_METHODS)  # e.g. ( 'get', 'post', ... )
+HTTP_METHOD_BY_VALUE = {m.value: m for m in HTTP_METHODS}  # e.g. { 'get': HttpMethod.GET }
+# Api-level attribute names resolved once at import
+DJAGGER_EXCLUDE_ATTR: str = ViewAttributes.api.DJAGGER_EXCLUDE.value
+SUMMARY_ATTR: str = ViewAttributes.api.SUMMARY.value
+DESCRIPTION_ATTR: str = ViewAttributes.api.DESCRIPTION.value
+OPERATION_ID_ATTR: str = ViewAttributes.api.OPERATION_ID.value
+EXTERNAL_DOCS_ATTR: str = ViewAttributes.api.EXTERNAL_DOCS.value
+TAGS_ATTR: str = ViewAttributes.api.TAGS.value
+REQUEST_SCHEMA_ATTR: str = ViewAttributes.api.REQUEST_SCHEMA.value
+RESPONSE_SCHEMA_ATTR: str = ViewAttributes.api.RESPONSE_SCHEMA.value
+SECURITY_ATTR: str = ViewAttributes.api.SECURITY.value
+SERVERS_ATTR: str = ViewAttributes.api.SERVERS.value
+DEPRECATED_ATTR: str = ViewAttributes.api.DEPRECATED.value
+OPTIONS_RESPONSE_SCHEMA_ATTR: str = ViewAttributes.retrieve_operation_attr_value(
+    RESPONSE_SCHEMA_ATTR, HttpMethod.OPTIONS
+)
+# Api-level attributes holding parameter schemas i.e. those ending in '_params'.
+# Request body params are handled by ``Operation._extract_request_body``
+PARAMETER_ATTRS = tuple(
+    attr
+    for attr in ViewAttributes.api.__members__.values()
+    if "_params" in attr and REQUEST_SCHEMA_ATTR not in attr
+)
+SERIALIZER_TYPES = (serializers.SerializerMetaclass, serializers.ListSerializer)
+SCHEMA_TYPES = (ModelMetaclass,) + SERIALIZER_TYPES  # Types accepted as a request/response schema
+
+
+class ValueModel(BaseModel):
+    """Base for small OpenAPI value objects. Instances are reused as-is rather than
+    copied when assigned to a field of another model.
+    """
+
+    class Config:
+        copy_on_model_validation = "none"
 
 
-class Logo(BaseModel):
+class Logo(ValueModel):
     """Logo image for display on redoc documents."""
 
     url: Optional[str]
     altText: Optional[str]
 
 
-class ExternalDocs(BaseModel):
+class ExternalDocs(ValueModel):
     description: Optional[str]
     url: str
 
 
-class Tag(BaseModel):
+class Tag(ValueModel):
     """OpenAPI `tags`"""
 
     name: str
@@ -45,7 +94,7 @@ class Tag(BaseModel):
     externalDocs: Optional[ExternalDocs]
 
 
-class Contact(BaseModel):
+class Contact(ValueModel):
     """OpenAPI `contact` object"""
 
     name: Optional[str]
@@ -53,7 +102,7 @@ class Contact(BaseModel):
     email: Optional[str]
 
 
-class License(BaseModel):
+class License(ValueModel):
     """OpenAPI `license` object"""
 
     name: str
@@ -85,7 +134,7 @@ class TagGroup(BaseModel):
     tags: List[str]
 
 
-class ServerVariable(BaseModel):
+class ServerVariable(ValueModel):
 
     enum: Optional[List[str]]
     default: str
@@ -99,7 +148,7 @@ class Server(BaseModel):
     variables: Optional[Dict[str, ServerVariable]]
 
 
-class Reference(BaseModel):
+class Reference(ValueModel):
 
     ref_: str = Field(alias="$ref")
 
@@ -112,7 +161,7 @@ class Reference(BaseModel):
     def to_ref(cls, obj: Any) -> Union["Reference", None]:
         # Check if variable is a valid dict representation of Ref
         # if valid, returns an instance of the Ref
-        if isinstance(obj, Dict):
+        if isinstance(obj, dict):
             try:
                 return cls(**obj)
             except (TypeError, ValidationError):
@@ -121,29 +170,31 @@ class Reference(BaseModel):
 
     @classmethod
     def dereference(cls, schema: Union[Dict, List], definitions: Dict):
-        """Recursively converts all references within a schema into the actual referenced object.
+        """Converts all references within a schema into the actual referenced object.
         The resulting schema is the same one without any references.
+        Nodes are walked with an explicit stack, and definitions shared by several references are only walked once.
         """
-        if isinstance(schema, Dict):
-            for k, v in schema.items():
-                ref = cls.to_ref(v)
-                if ref:
-                    ref_obj = definitions.get(ref.ref_name(), {})
-                    schema[k] = cls.dereference(ref_obj, definitions)
-
-                elif isinstance(v, Dict) or isinstance(v, List):
-                    schema[k] = cls.dereference(v, definitions)
+        stack = [schema] if isinstance(schema, (dict, list)) else []
+        seen = set()
 
-        if isinstance(schema, List):
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
 
-            for i in range(len(schema)):
-                ref = cls.to_ref(schema[i])
-                if ref:
-                    ref_obj = definitions.get(ref.ref_name(), {})
-                    schema[i] = cls.dereference(ref_obj, definitions)
+            for k, v in node.items() if isinstance(node, dict) else enumerate(node):
+                if isinstance(v, dict):
+                    # Inline check for a reference object instead of validating a ``Reference``
+                    ref = v.get("$ref")
+                    if isinstance(ref, str):
+                        # Assuming reference has default ref_template '#/definitions/{model}'
+                        v = definitions.get(ref.split("/")[-1], {})
+                        node[k] = v
+                    stack.append(v)
 
-                elif isinstance(schema[i], Dict) or isinstance(schema[i], List):
-                    schema[i] = cls.dereference(schema[i], definitions)
+                elif isinstance(v, list):
+                    stack.append(v)
 
         return schema
 
@@ -151,7 +202,7 @@ class Reference(BaseModel):
         allow_population_by_field_name = True
 
 
-class Example(BaseModel):
+class Example(ValueModel):
 
     summary: Optional[str]
     description: Optional[str]
@@ -234,7 +285,7 @@ class Header(BaseModel):
         allow_population_by_field_name = True
 
 
-class Encoding(BaseModel):
+class Encoding(ValueModel):
 
     contentType: Optional[str]
     headers: Optional[Dict[str, Union[Header, Reference]]]
@@ -255,36 +306,52 @@ class MediaType(BaseModel):
     class Config:
         allow_population_by_field_name = True
 
+    @classmethod
+    @lru_cache(maxsize=512)
+    def model_schema(cls, model: Any) -> Dict:
+        """Returns the dereferenced JSON schema of a pydantic model, with ``example`` set if available.
+        Results are cached per model, so models shared across endpoints are only processed once.
+        """
+        # Copy as pydantic caches and returns the same ``.schema()`` dict on every call
+        schema = copy.deepcopy(model.schema())
+        schema = schema_set_examples(schema, model)
+
+        definitions = schema.pop("definitions", {})
+        if not definitions:
+            return schema
+
+        return Reference.dereference(schema, definitions)
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def model_example(cls, model: Any) -> Optional[Dict]:
+        """Returns the serialized result of the model's ``example()`` classmethod, or None if it has none.
+        Results are cached per model like ``model_schema``.
+        """
+        if callable(getattr(model, "example", None)):
+            return model.example().dict(by_alias=True, exclude_none=True)
+        return None
+
     @classmethod
     def _from(cls, model: Any) -> "MediaType":
         """Generates an instance of MediaType from a pydantic model or from a rest_framework serializer"""
 
-        media = cls()
+        media = cls.construct()
 
-        if isinstance(
-            model, (serializers.SerializerMetaclass, serializers.ListSerializer)
-        ):
-            model = SerializerConverter(s=model).to_model()
+        if isinstance(model, SERIALIZER_TYPES):
+            model = SerializerConverter.model_from(model)
 
-        schema = model.schema()
-        schema = schema_set_examples(schema, model)
-
-        definitions = schema.pop("definitions", {})
-        if not definitions:
-            media.schema_ = schema
-        else:
-            media.schema_ = Reference.dereference(schema, definitions)
+        media.schema_ = cls.model_schema(model)
 
         # Generate example
-        if callable(getattr(model, "example", None)):
-            media.example = model.example().dict(by_alias=True, exclude_none=True)
+        media.example = cls.model_example(model)
 
         # TODO: Handle multiple examples for ``examples`` field
 
         # Look for ``encoding`` in model Config and instantiate it
         encoding = getattr(model.Config, "encoding", {})
 
-        if not isinstance(encoding, Dict):
+        if not isinstance(encoding, dict):
             raise TypeError("encoding in model Config needs to be a Dict")
 
         if encoding:
@@ -314,6 +381,17 @@ class Parameter(BaseModel):
     class Config:
         allow_population_by_field_name = True
 
+    @classmethod
+    @lru_cache(maxsize=512)
+    def model_field_schemas(cls, model: ModelMetaclass) -> Tuple[Dict, ...]:
+        """Returns the dereferenced JSON schema of each field of a pydantic model.
+        Results are cached per model, so a model used for several parameter kinds or endpoints is only processed once.
+        """
+        return tuple(
+            Reference.dereference(schema, definitions) if definitions else schema
+            for schema, definitions in model_field_schemas(model)
+        )
+
     @classmethod
     def to_parameters(
         cls, model: ModelMetaclass, attr: DjaggerAttributeEnumType
@@ -344,22 +422,18 @@ class Parameter(BaseModel):
         # Handle parameters - path / query / header/ cookie
         # with each field as a separate parameter in the list of parameters
 
-        schemas = model_field_schemas(model)
+        # Parameter location is the same for every field of the model
+        location: Optional[str] = attr.location()
+        is_path = location == ParameterLocation.PATH.value
 
-        for schema, definitions in schemas:
+        for schema in cls.model_field_schemas(model):
 
-            if definitions:
-                schema = Reference.dereference(schema, definitions)
-
-            location: Optional[str] = attr.location()
-
-            param = cls(
+            # ``construct`` skips validation as the values come from pydantic's own field schemas
+            param = cls.construct(
                 name=schema.get("title", ""),
                 description=schema.get("description", ""),
-                in_=attr.location(),
-                required=True
-                if location == ParameterLocation.PATH
-                else schema.get("required", False),
+                in_=location,
+                required=True if is_path else schema.get("required", False),
                 deprecated=schema.get("deprecated", False),
                 allowReserved=schema.get("allowReserved", False),
                 style=schema.get("style"),
@@ -371,6 +445,10 @@ class Parameter(BaseModel):
         return params
 
 
+# Keys in a request body dict attribute that are not media types
+REQUEST_BODY_KEYS = ("description", "required")
+
+
 class RequestBody(BaseModel):
     description: Optional[str]
     content: Dict[str, MediaType] = {}
@@ -394,24 +472,36 @@ class Response(BaseModel):
         # By default if a pydantic model is passed, the only content type is application/json for MediaType
         # to allow multiple content in a Response object, a python dict needs to be passed manually.
         # via Response.parse_obj(my_dict)
-        response = cls(
+        response = cls.construct(
             description=model.__doc__ if model.__doc__ else "",
             content={content_type: MediaType._from(model)},
         )
 
         if isinstance(model, ModelMetaclass):
-            # Extract headers dict in the Response model Config
-            headers = getattr(model.Config, "headers", {})
-            if headers and isinstance(headers, Dict):
-                response.headers = {}
-                for k, v in headers.items():
-                    try:
-                        response.headers[k] = Header.parse_obj(v)
-                    except ValidationError as e:
-                        warnings.warn(f"Validation error in header: {str(e)}")
+            response.headers = cls.model_headers(model)
 
         return response
 
+    @classmethod
+    @lru_cache(maxsize=512)
+    def model_headers(cls, model: ModelMetaclass) -> Optional[Dict[str, Header]]:
+        """Parses the ``headers`` dict in the model Config into ``Header`` objects, or returns None if there is none.
+        The result is cached so that models shared by many responses are parsed once. It must not be mutated.
+        """
+        # Extract headers dict in the Response model Config
+        headers = getattr(model.Config, "headers", {})
+        if not headers or not isinstance(headers, dict):
+            return None
+
+        parsed = {}
+        for k, v in headers.items():
+            try:
+                parsed[k] = Header.parse_obj(v)
+            except ValidationError as e:
+                warnings.warn(f"Validation error in header: {str(e)}")
+
+        return parsed
+
 
 Responses = Dict[str, Response]
 
@@ -436,7 +526,7 @@ class Operation(BaseModel):
     def _extract_operation_id(self, view: Type, http_method: HttpMethod):
 
         operation_id = ViewAttributes.from_view(
-            view, ViewAttributes.api.OPERATION_ID, http_method
+            view, OPERATION_ID_ATTR, http_method
         )
         assert isinstance(
             operation_id, (str, type(None))
@@ -446,10 +536,10 @@ class Operation(BaseModel):
     def _extract_external_docs(self, view: Type, http_method: HttpMethod):
 
         self.externalDocs = ViewAttributes.from_view(
-            view, ViewAttributes.api.EXTERNAL_DOCS, http_method
+            view, EXTERNAL_DOCS_ATTR, http_method
         )
         assert isinstance(
-            self.externalDocs, (Dict, type(None))
+            self.externalDocs, (dict, type(None))
         ), "externalDocs attribute needs to be a dict"
 
         if self.externalDocs:
@@ -460,59 +550,40 @@ class Operation(BaseModel):
 
         self.parameters = []
 
-        for attr in ViewAttributes.api.__members__.values():
-
-            if "_params" not in attr:
-                # only consider relevant for parameter attributes - attr name ending in '_params'
-                continue
-
-            if ViewAttributes.api.REQUEST_SCHEMA.value in attr:
-                # request body params handed by _extract_request_body()
-                continue
+        for attr in PARAMETER_ATTRS:
 
             request_schema = ViewAttributes.from_view(view, attr, http_method)
             if not request_schema:
                 continue
 
             # Converting serializers to pydantic models
-            if isinstance(
-                request_schema,
-                (serializers.SerializerMetaclass, serializers.ListSerializer),
-            ):
-                request_schema = SerializerConverter(s=request_schema).to_model()
+            if isinstance(request_schema, SERIALIZER_TYPES):
+                request_schema = SerializerConverter.model_from(request_schema)
 
             self.parameters += Parameter.to_parameters(request_schema, attr)
 
     def _extract_tags(self, view: Type, http_method: HttpMethod):
 
-        tags = ViewAttributes.from_view(view, ViewAttributes.api.TAGS, http_method)
+        tags = ViewAttributes.from_view(view, TAGS_ATTR, http_method)
 
         if not tags:
-            try:
-                tags = [
-                    view.cls.__module__.split(".")[0]
-                ]  # Set tags as the app module name of the parent class as fallback
-            except AttributeError:
-                tags = [
-                    view.__module__.split(".")[0]
-                ]  # Set tags as the app module name of the fbv as fallback
+            # Set tags as the app module name of the parent class as fallback,
+            # or of the fbv itself if there is no parent class
+            tags = [getattr(view, "cls", view).__module__.split(".")[0]]
 
         if tags:
-            assert isinstance(tags, List), "tags attribute must be a list of strings"
+            assert isinstance(tags, list), "tags attribute must be a list of strings"
             self.tags = tags
 
     def _extract_summary(self, view: Type, http_method: HttpMethod):
 
         summary = ViewAttributes.from_view(
-            view, ViewAttributes.api.SUMMARY, http_method
+            view, SUMMARY_ATTR, http_method
         )
 
         if not summary:
-            # Fallback to getting summary from class parent
-            try:
-                summary = view.cls.__name__
-            except AttributeError:
-                summary = view.__name__
+            # Fallback to getting summary from class parent, or the view name itself
+            summary = getattr(view, "cls", view).__name__
 
         if summary:
             assert isinstance(summary, str), "summary must be string type"
@@ -521,7 +592,7 @@ class Operation(BaseModel):
     def _extract_description(self, view: Type, http_method: HttpMethod):
 
         description = ViewAttributes.from_view(
-            view, ViewAttributes.api.DESCRIPTION, http_method
+            view, DESCRIPTION_ATTR, http_method
         )
         if not description:
             # Try to retrieve from method docstring
@@ -535,10 +606,9 @@ class Operation(BaseModel):
         if not description:
             # fallback toe get description from parent cbv docstring
             # when view is a FBV
-            try:
-                description = view.cls.__doc__
-            except AttributeError:
-                pass
+            parent = getattr(view, "cls", None)
+            if parent is not None:
+                description = parent.__doc__
 
         if description:
             assert isinstance(description, str), "description must be string type"
@@ -552,21 +622,14 @@ class Operation(BaseModel):
         """
 
         request_body = ViewAttributes.from_view(
-            view, ViewAttributes.api.REQUEST_SCHEMA, http_method
+            view, REQUEST_SCHEMA_ATTR, http_method
         )
         if not request_body:
             return
 
         # Case where a pydantic model is passed, assumes only one media type i.e. application/json
-        if isinstance(
-            request_body,
-            (
-                ModelMetaclass,
-                serializers.SerializerMetaclass,
-                serializers.ListSerializer,
-            ),
-        ):
-            self.requestBody = RequestBody(
+        if isinstance(request_body, SCHEMA_TYPES):
+            self.requestBody = RequestBody.construct(
                 description=request_body.__doc__,
                 content={"application/json": MediaType._from(request_body)},
             )
@@ -581,25 +644,22 @@ class Operation(BaseModel):
         #     'application/json': Schema_1,
         #     'text/plain': Schema_2
         # }
-        elif isinstance(request_body, Dict):
+        elif isinstance(request_body, dict):
 
-            body = RequestBody()
-            body.description = request_body.pop("description", "")
-            body.required = request_body.pop("required", False)
+            # Read without popping so the dict set on the view is left intact for subsequent calls
+            body = RequestBody.construct()
+            body.description = request_body.get("description", "")
+            body.required = request_body.get("required", False)
             content = {}
             for k, v in request_body.items():
-                if isinstance(v, Dict):
+                if k in REQUEST_BODY_KEYS:
+                    continue
+
+                if isinstance(v, dict):
                     # validate for MediaType if a dict is given as the value of content
                     content[k] = MediaType(**v)
 
-                elif isinstance(
-                    v,
-                    (
-                        ModelMetaclass,
-                        serializers.SerializerMetaclass,
-                        serializers.ListSerializer,
-                    ),
-                ):
+                elif isinstance(v, SCHEMA_TYPES):
                     content[k] = MediaType._from(v)
 
                 else:
@@ -624,22 +684,15 @@ class Operation(BaseModel):
         responses = {}
 
         response_schema = ViewAttributes.from_view(
-            view, ViewAttributes.api.RESPONSE_SCHEMA, http_method
+            view, RESPONSE_SCHEMA_ATTR, http_method
         )
 
         # When attribute is a pydantic model or serializer - assume 200 response only
-        if isinstance(
-            response_schema,
-            (
-                ModelMetaclass,
-                serializers.SerializerMetaclass,
-                serializers.ListSerializer,
-            ),
-        ):
+        if isinstance(response_schema, SCHEMA_TYPES):
             responses = {"200": Response._from(response_schema)}
 
         # When attribute is a dict of responses, prepare dict of Response values
-        elif isinstance(response_schema, Dict):
+        elif isinstance(response_schema, dict):
 
             for key, model in response_schema.items():
 
@@ -675,17 +728,10 @@ class Operation(BaseModel):
                         "response schema dict key needs to be of tuple type or string"
                     )
 
-                if isinstance(
-                    model,
-                    (
-                        ModelMetaclass,
-                        serializers.SerializerMetaclass,
-                        serializers.ListSerializer,
-                    ),
-                ):
+                if isinstance(model, SCHEMA_TYPES):
                     responses[status_code] = Response._from(model, content_type)
 
-                elif isinstance(model, Dict):
+                elif isinstance(model, dict):
                     # For manual parsing if a Dict is passed instead of the expected ModelMetaclass or Serializer
                     # Ignores any content_type set above.
                     responses[status_code] = Response.parse_obj(model)
@@ -695,23 +741,23 @@ class Operation(BaseModel):
     def _extract_security(self, view: Type, http_method: HttpMethod):
 
         self.security = ViewAttributes.from_view(
-            view, ViewAttributes.api.SECURITY, http_method
+            view, SECURITY_ATTR, http_method
         )
         assert isinstance(
-            self.servers, (List, type(None))
+            self.servers, (list, type(None))
         ), "security attribute needs to be a list of objects"
 
         if self.security:
             for security in self.security:
                 assert isinstance(
-                    security, Dict
+                    security, dict
                 ), "security items need to be dict of list of strings"
                 for k, v in security.items():
                     assert isinstance(
                         k, str
                     ), "security requirement key needs to be a string"
                     assert isinstance(
-                        v, List
+                        v, list
                     ), "security requirement value needs to be list of strings"
                     for m in v:
                         assert isinstance(
@@ -721,10 +767,10 @@ class Operation(BaseModel):
     def _extract_servers(self, view: Type, http_method: HttpMethod):
 
         self.servers = ViewAttributes.from_view(
-            view, ViewAttributes.api.SERVERS, http_method
+            view, SERVERS_ATTR, http_method
         )
         assert isinstance(
-            self.servers, (List, type(None))
+            self.servers, (list, type(None))
         ), "servers attribute needs to be a list of server objects"
         if self.servers:
             self.servers = [Server.parse_obj(server) for server in self.servers]
@@ -732,29 +778,40 @@ class Operation(BaseModel):
     def _extract_deprecated(self, view: Type, http_method: HttpMethod):
 
         self.deprecated = ViewAttributes.from_view(
-            view, ViewAttributes.api.DEPRECATED, http_method
+            view, DEPRECATED_ATTR, http_method
         )
         assert isinstance(
             self.deprecated, (bool, type(None))
         ), "deprecated attribute needs to be boolean"
 
     @classmethod
-    def _from(cls, view: Any, http_method: HttpMethod) -> Union["Operation", None]:
+    def _from(
+        cls,
+        view: Any,
+        http_method: HttpMethod,
+        cache: Optional["OperationCache"] = None,
+    ) -> Union["Operation", None]:
         """Extract attributes from a view class to instantiate Operation given the type of http method for the Operation.
         Wil return None if exclude attribute is True.
+        If a ``cache`` dict is passed, results are memoized by view, parent ``cls`` of the view and http method.
         """
 
-        operation = cls(
-            tags=[], summary="", description="", parameters=[], responses={}
-        )
+        if cache is not None:
+            key = (view, getattr(view, "cls", None), http_method)
+            if key not in cache:
+                cache[key] = cls._from(view, http_method)
+            return cache[key]
 
         # Exclude at the method-level if `<http_method>_djagger_exclude` is True
-        exclude = ViewAttributes.from_view(
-            view, ViewAttributes.api.DJAGGER_EXCLUDE, http_method
-        )
+        exclude = ViewAttributes.from_view(view, DJAGGER_EXCLUDE_ATTR, http_method)
         if exclude:
             return None
 
+        # Trusted default values - skip pydantic validation
+        operation = cls.construct(
+            tags=[], summary="", description="", parameters=[], responses={}
+        )
+
         operation._extract_tags(view, http_method)
         operation._extract_operation_id(view, http_method)
         operation._extract_deprecated(view, http_method)
@@ -770,6 +827,10 @@ class Operation(BaseModel):
         return operation
 
 
+# Memoized ``Operation._from`` results keyed by (view, parent cls, http method)
+OperationCache = Dict[Tuple[Any, Any, HttpMethod], Optional[Operation]]
+
+
 class Path(BaseModel):
 
     summary: Optional[str]
@@ -790,46 +851,51 @@ class Path(BaseModel):
 
     class Config:
         allow_population_by_field_name = True
+        # Paths are reused as-is by ``Document`` instead of being copied during validation
+        copy_on_model_validation = "none"
 
     @classmethod
-    def create(cls, view: Type) -> "Path":
+    def create(
+        cls, view: Type, operation_cache: Optional[OperationCache] = None
+    ) -> "Path":
         """Given a Class-based view or a function based view, create the Path object
         from the Djagger attributes set in the view.
+        ``operation_cache`` is passed to ``Operation._from`` to reuse operations of views shared across url patterns.
         """
-        path = cls(
-            summary=getattr(view, ViewAttributes.api.SUMMARY, None),
-            description=getattr(view, ViewAttributes.api.DESCRIPTION, None),
-        )
+        # Operations by http method string e.g. { 'get': Operation }
+        operations: Dict[str, Operation] = {}
 
-        if inspect.isclass(view):
+        if isinstance(view, type):
 
             # For generic API views, set ``response_schema`` if it does not yet exist to the value in ``serializer_class``
             set_response_schema_from_serializer_class(view)
 
             # For CBV or DRF API, check for methods by looking for get(), post(), patch(), ... methods
-            for http_method in HttpMethod.__members__.values():
-
-                if callable(getattr(view, http_method, None)):
-                    if http_method == HttpMethod.OPTIONS:
-                        # Special handling of OPTIONS method documentation as it is automatically present in every CBV
-                        # Only auto-document OPTIONS if a specific ``options_response_schema`` attribute is detected.
-                        if not hasattr(view, "options_response_schema"):
-                            continue
-
-                    view_func = getattr(
-                        view, http_method
-                    )  # i.e. get(), post(), put() ...
-                    # Add the View class as an attribute 'cls' to the action view function
-                    # as a fallback reference.
-                    view_func.cls = view
+            for http_method in HTTP_METHODS:
 
-                    operation = Operation._from(view_func, http_method)
-                    if not operation:
+                view_func = getattr(
+                    view, http_method.value, None
+                )  # i.e. get(), post(), put() ...
+                if not callable(view_func):
+                    continue
+
+                if http_method is HttpMethod.OPTIONS:
+                    # Special handling of OPTIONS method documentation as it is automatically present in every CBV
+                    # Only auto-document OPTIONS if a specific ``options_response_schema`` attribute is detected.
+                    if not hasattr(view, OPTIONS_RESPONSE_SCHEMA_ATTR):
                         continue
 
-                    setattr(path, http_method, operation)
+                # Add the View class as an attribute 'cls' to the action view function
+                # as a fallback reference.
+                view_func.cls = view
+
+                operation = Operation._from(view_func, http_method, operation_cache)
+                if not operation:
+                    continue
+
+                operations[http_method.value] = operation
 
-        elif inspect.isfunction(view):
+        elif type(view) is FunctionType:
 
             if hasattr(view, "actions"):
 
@@ -841,9 +907,8 @@ class Path(BaseModel):
                 actions: Dict[str, str] = getattr(view, "actions", {})
 
                 for method, action in actions.items():
-                    try:
-                        http_method = HttpMethod(method.lower())
-                    except ValueError:
+                    http_method = HTTP_METHOD_BY_VALUE.get(method.lower())
+                    if http_method is None:
                         continue
 
                     viewset_class = getattr(view, "cls", None)
@@ -858,27 +923,35 @@ class Path(BaseModel):
                     # as a fallback reference.
                     action_fbv_view.cls = viewset_class
 
-                    operation = Operation._from(action_fbv_view, http_method)
+                    operation = Operation._from(
+                        action_fbv_view, http_method, operation_cache
+                    )
                     if not operation:
                         continue
 
-                    setattr(path, http_method, operation)
+                    operations[http_method.value] = operation
 
             # For regular FBVs, check for existence of http methods from the `djagger_http_methods` attribute
             # set by the @schema decorator
 
-            if not hasattr(view, DJAGGER_HTTP_METHODS):
-                return path
-
             for method in getattr(view, DJAGGER_HTTP_METHODS, []):
-                http_method = HttpMethod(method.lower())
-                operation = Operation._from(view, http_method)
+                http_method = HTTP_METHOD_BY_VALUE.get(method.lower())
+                if http_method is None:
+                    continue
+
+                operation = Operation._from(view, http_method, operation_cache)
                 if not operation:
                     continue
 
-                setattr(path, http_method, operation)
+                operations[http_method.value] = operation
 
-        return path
+        # Model is only constructed once all operations have been extracted.
+        # ``construct`` skips validation so operations are not re-validated and copied
+        return cls.construct(
+            summary=getattr(view, SUMMARY_ATTR, None),
+            description=getattr(view, DESCRIPTION_ATTR, None),
+            **operations,
+        )
 
 
 Paths = Dict[str, Path]
@@ -896,11 +969,14 @@ class Components(BaseModel):
     links: Dict[str, Union[Link, Reference]] = {}
     callbacks: Dict[str, Union[Callback, Reference]] = {}
 
-    def merge(self, component: "Components"):
-        """Copy the contents of another ``Components`` instance and merge it into this instance"""
+    def merge(self, component: "Components", deep: bool = False):
+        """Merge the contents of another ``Components`` instance into this instance.
+        Entries are shared with ``component`` unless ``deep`` is True, in which case they are deep copied.
+        """
 
         for field in self.__fields__.keys():
-            getattr(self, field).update(copy.deepcopy(getattr(component, field)))
+            entries = getattr(component, field)
+            getattr(self, field).update(copy.deepcopy(entries) if deep else entries)
 
 
 class Document(BaseModel):
@@ -914,11 +990,41 @@ class Document(BaseModel):
     tags: List[Tag] = []
     externalDocs: Optional[ExternalDocs]
 
+    @classmethod
+    def iter_paths(
+        cls,
+        app_names: List[str] = [],
+        url_names: List[str] = [],
+        operation_cache: Optional[OperationCache] = None,
+    ) -> Iterator[Tuple[str, Path]]:
+        """Yields ``(route, Path)`` pairs for the documented URLPatterns in the given apps, one at a time.
+        By default no operations are kept between paths, so a caller that converts and drops each ``Path``
+        e.g. with ``model_to_dict`` only holds the operations of the current path.
+        Passing an ``operation_cache`` dict reuses operations of views shared across url patterns,
+        at the cost of keeping every operation alive until the cache is dropped.
+        """
+
+        url_patterns = get_url_patterns(app_names, url_names)
+
+        for route, url_pattern in url_patterns:
+
+            # Class-based View, or Function-based View / ViewSet when ``view_class`` is absent
+            view = getattr(url_pattern.callback, "view_class", url_pattern.callback)
+
+            if ViewAttributes.from_view(view, DJAGGER_EXCLUDE_ATTR):
+                continue
+
+            path = Path.create(view, operation_cache)
+
+            # Document the path if it has at least one http method view function
+            if any(getattr(path, name) is not None for name in HTTP_METHOD_NAMES):
+                yield f"/{route}", path
+
     @classmethod
     def generate(
         cls,
         app_names: List[str] = [],
-        tags: List[Dict[str, str]] = [],
+        tags: List[Union[Tag, Dict[str, str]]] = [],
         openapi="3.0.0",
         version="1.0.0",
         servers: List[Server] = [],
@@ -939,41 +1045,37 @@ class Document(BaseModel):
         Returns the JSON string object for the resulting OAS document.
         """
 
-        url_patterns = get_url_patterns(app_names, url_names)
-        paths: Dict[str, Path] = {}
-
-        for route, url_pattern in url_patterns:
-
-            try:
-                view = url_pattern.callback.view_class  # Class-based View
-            except AttributeError:
-                view = url_pattern.callback  # Function-based View / ViewSet
-
-            if ViewAttributes.from_view(view, ViewAttributes.api.DJAGGER_EXCLUDE.value):
-                continue
-
-            path = Path.create(view)
-
-            # Document the path if it has at least one http method view function
-            for method_name in HttpMethod.values():
-                if getattr(path, method_name, None):
-                    paths["/" + route] = path
-                    break
+        # All paths are held for the document anyway, so share operations across url patterns
+        operation_cache: OperationCache = {}
+        paths: Dict[str, Path] = dict(
+            cls.iter_paths(app_names, url_names, operation_cache)
+        )
 
         # Create tag objects as provided
         # Note that if tags supplied is empty, they will still be generated when
         # set as attributes in the individual API or endpoints
         tags_ = [
-            Tag(name=tag["name"], description=tag.get("description", ""))
+            tag
+            if isinstance(tag, Tag)
+            else Tag(name=tag["name"], description=tag.get("description", ""))
             for tag in tags
         ]
+        # Contact and License are optional; leave them out when none of their fields are set
+        contact = None
+        if contact_name or contact_email or contact_url:
+            contact = Contact(name=contact_name, email=contact_email, url=contact_url)
+
+        license_ = None
+        if license_name or license_url:
+            license_ = License(name=license_name, url=license_url)
+
         info = Info(
             description=description,
             version=version,
             title=title,
             termsOfService=terms_of_service,
-            contact=Contact(name=contact_name, email=contact_email, url=contact_url),
-            license=License(name=license_name, url=license_url),
+            contact=contact,
+            license=license_,
         )
         document = cls(
             openapi=openapi,
@@ -985,7 +1087,26 @@ class Document(BaseModel):
             components=components,
         )
 
-        document_dict = document.dict(by_alias=True, exclude_none=True)
+        document_dict = model_to_dict(document)
         document_dict.update(kwargs)  # Non OAS specification keys
 
         return document_dict
+
+    @classmethod
+    def generate_json(cls, **kwargs) -> bytes:
+        """Generates the OAS document with ``Document.generate`` and returns it serialized as JSON bytes.
+        Uses ``orjson`` if it is installed, otherwise falls back to the standard library ``json`` module.
+        Datetimes and values that are not natively JSON serializable are encoded the same way as Django's ``JsonResponse``,
+        so the output is the same with or without ``orjson``.
+        """
+        document = cls.generate(**kwargs)
+
+        if orjson is not None:
+            return orjson.dumps(
+                document,
+                default=DjangoJSONEncoder().default,
+                # Leave datetimes to ``DjangoJSONEncoder`` so output does not depend on orjson being installed
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+
+        return json.dumps(document, cls=DjangoJSONEncoder).encode()
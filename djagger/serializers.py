@@ -4,6 +4,7 @@ from pydantic.main import ModelMetaclass
 from pydantic import BaseModel, create_model
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 
 
 def field_to_pydantic_args(f: fields.Field) -> Dict:
@@ -246,3 +247,15 @@ class SerializerConverter(BaseModel):
         if isinstance(self.s, serializers.SerializerMetaclass):
             # Instantiates the serializer to be passed to ``from_serializer``
             return self.from_serializer(self.s())
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def model_from(
+        cls,
+        s: Union[serializers.SerializerMetaclass, serializers.ListSerializer],
+    ) -> ModelMetaclass:
+        """Converts a serializer class or ``ListSerializer`` instance into a pydantic model with ``to_model()``.
+        Results are cached per serializer so a serializer shared by many endpoints is converted once,
+        and ``MediaType.model_schema`` can reuse the schema of the resulting model.
+        """
+        return cls(s=s).to_model()
@@ -342,6 +342,23 @@ def test_extract_request_body():
     for media in operation.requestBody.content.values():
         assert isinstance(media, MediaType)
 
+    # 6. Case where description and required are passed in the dict
+    # and the view attribute is extracted more than once
+
+    class View:
+        request_schema = {
+            "description": "multiple request bodies",
+            "required": True,
+            "application/json": Params,
+        }
+
+    for _ in range(2):
+        operation = Operation()
+        operation._extract_request_body(View, HttpMethod.POST)
+        assert operation.requestBody.description == "multiple request bodies"
+        assert operation.requestBody.required
+        assert list(operation.requestBody.content) == ["application/json"]
+
 
 def test_extract_responses():
     class ResponseSchema(BaseModel):
@@ -462,6 +479,11 @@ def test_extract_parameters():
 
     operation = Operation()
     operation._extract_parameters(View, HttpMethod.GET)
+    assert [(p.name, p.in_, p.required) for p in operation.parameters] == [
+        ("pk", "path", True),
+        ("name", "path", True),
+        ("page", "query", False),
+    ]
 
     # 1.5 - Test query and path parameters with serializers
 
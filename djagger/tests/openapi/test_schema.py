@@ -1,8 +1,24 @@
 from pydantic import BaseModel
+from typing import List
+from collections import namedtuple
 
 from ...enums import HttpMethod
 
-from ...openapi import MediaType, Operation, Path, Document
+from ...openapi import (
+    MediaType,
+    Operation,
+    Path,
+    Document,
+    Info,
+    Tag,
+    SecurityScheme,
+    Response,
+    Reference,
+    Components,
+    Parameter,
+    Example,
+)
+from ...utils import model_to_dict
 
 
 def test_document():
@@ -27,6 +43,11 @@ def test_media_type_from():
     media = MediaType._from(M)
     assert media.dict(by_alias=True)
 
+    # Serialized example is cached per model
+    assert media.example == {"value1": "value1", "value2": "value2", "n": {"value3": "value3"}}
+    assert MediaType._from(M).example is media.example
+    assert MediaType._from(N).example is None
+
 
 def test_operation_from():
     class BodyParams(BaseModel):
@@ -70,3 +91,214 @@ def test_path_create():
 
     # print(path.dict(by_alias=True, exclude_none=True))
     assert path.dict(by_alias=True)
+
+
+def test_path_create_methods():
+
+    # Only callable http methods are documented and OPTIONS is skipped
+    # unless ``options_response_schema`` is set
+
+    class View:
+
+        put = "not callable"
+
+        def get(self):
+            return None
+
+        def options(self):
+            return None
+
+    path = Path.create(View)
+
+    assert path.get
+    assert path.put is None
+    assert path.options is None
+
+    View.options_response_schema = {}
+    path = Path.create(View)
+
+    assert path.options
+
+    # Paths are not copied when validated into a Document
+    document = Document(info=Info(), paths={"/view": path})
+    assert document.paths["/view"] is path
+
+
+def test_model_to_dict():
+
+    # Output must match pydantic's ``.dict(by_alias=True, exclude_none=True)``
+
+    class QueryParams(BaseModel):
+        """Test query params"""
+
+        value1: str
+        value2: int = 1
+
+    class ResponseSchema(BaseModel):
+        """Test response schema"""
+
+        msg: str
+
+        @classmethod
+        def example(cls):
+            return cls(msg="msg")
+
+    class View:
+
+        query_params = QueryParams
+        response_schema = {"200": ResponseSchema, ("400", "text/plain"): ResponseSchema}
+        tags = ["tag"]
+
+        def get(self):
+            return None
+
+        def post(self):
+            return None
+
+    document = Document(
+        info=Info(x_logo={"url": "url"}),
+        paths={"/view": Path.create(View)},
+        tags=[Tag(name="tag")],
+    )
+    document.components.securitySchemes["basic"] = SecurityScheme(
+        type="http", scheme="basic"
+    )
+
+    assert model_to_dict(document) == document.dict(by_alias=True, exclude_none=True)
+
+    # namedtuples are rebuilt from positional items
+    NT = namedtuple("NT", ["x", "y"])
+    example = Example(value={"k": NT(1, Tag(name="tag"))})
+    assert model_to_dict(example) == example.dict(by_alias=True, exclude_none=True)
+
+
+def test_path_create_operation_cache():
+
+    # Operations are reused for the same view but not across views
+    # that inherit the same method
+
+    class View:
+
+        summary = "View"
+
+        def get(self):
+            return None
+
+    class SubView(View):
+
+        summary = "SubView"
+
+    operation_cache = {}
+
+    path_1 = Path.create(View, operation_cache)
+    path_2 = Path.create(View, operation_cache)
+    path_3 = Path.create(SubView, operation_cache)
+
+    assert path_1.get is path_2.get
+    assert path_3.get.summary == "SubView"
+
+
+def test_media_type_model_schema():
+
+    # Schema is cached per model and pydantic's own schema cache is left untouched
+
+    class N(BaseModel):
+        value2: str
+
+    class M(BaseModel):
+        value1: str
+        n: N
+
+    schema = MediaType.model_schema(M)
+
+    assert "definitions" not in schema
+    assert schema["properties"]["n"]["properties"]["value2"]
+    assert MediaType.model_schema(M) is schema
+    assert "definitions" in M.schema()
+
+
+def test_response_model_headers():
+
+    # Headers in the model Config are parsed once per model
+
+    class M(BaseModel):
+        value1: str
+
+        class Config:
+            headers = {"X-Rate-Limit": {"description": "Rate limit"}}
+
+    class N(BaseModel):
+        value1: str
+
+    response = Response._from(M)
+
+    assert response.headers["X-Rate-Limit"].description == "Rate limit"
+    assert Response._from(M).headers is response.headers
+    assert Response._from(N).headers is None
+
+
+def test_reference_dereference():
+
+    definitions = {
+        "N": {"title": "N", "properties": {"value": {"type": "string"}}},
+        "M": {
+            "title": "M",
+            "properties": {
+                "n": {"$ref": "#/definitions/N"},
+                "ns": {"type": "array", "items": {"$ref": "#/definitions/N"}},
+            },
+        },
+    }
+    schema = {
+        "properties": {
+            "m": {"$ref": "#/definitions/M"},
+            "any": {"anyOf": [{"$ref": "#/definitions/N"}, {"type": "integer"}]},
+            "missing": {"$ref": "#/definitions/X"},
+        }
+    }
+
+    schema = Reference.dereference(schema, definitions)
+
+    n = {"title": "N", "properties": {"value": {"type": "string"}}}
+    assert schema["properties"]["m"]["properties"]["n"] == n
+    assert schema["properties"]["m"]["properties"]["ns"]["items"] == n
+    assert schema["properties"]["any"]["anyOf"] == [n, {"type": "integer"}]
+    assert schema["properties"]["missing"] == {}
+    assert "$ref" not in str(schema)
+
+
+def test_components_merge():
+
+    schema = {"type": "string"}
+    component = Components(schemas={"S": schema})
+
+    components = Components()
+    components.merge(component)
+    assert components.schemas["S"] is component.schemas["S"]
+
+    components = Components()
+    components.merge(component, deep=True)
+    assert components.schemas["S"] == component.schemas["S"]
+    assert components.schemas["S"] is not component.schemas["S"]
+
+
+def test_parameter_model_field_schemas():
+
+    # Field schemas are dereferenced and cached per model
+
+    class N(BaseModel):
+        value2: str
+
+    class M(BaseModel):
+        value1: str
+        ns: List[N]
+        n: N
+
+    schemas = Parameter.model_field_schemas(M)
+
+    assert [schema["title"] for schema in schemas] == ["value1", "ns", "n"]
+    assert schemas[1]["items"]["properties"]["value2"]
+    # Only references nested below a field schema are resolved. A bare model-typed
+    # parameter field is itself a reference and is left as an unresolved ``$ref``
+    assert schemas[2]["$ref"] == "#/definitions/N"
+    assert Parameter.model_field_schemas(M) is schemas
@@ -0,0 +1,58 @@
+from ..config import get_djagger_config, DjaggerConfig
+
+
+def test_get_djagger_config():
+
+    # Repeated calls share the same validated instance
+
+    config = get_djagger_config()
+    assert isinstance(config, DjaggerConfig)
+    assert get_djagger_config() is config
+
+    get_djagger_config.cache_clear()
+    assert get_djagger_config() is not config
+
+
+def test_djagger_config_parse_obj():
+
+    # Unknown keys are ignored
+
+    config = DjaggerConfig.parse_obj({"global_prefix": "djagger_", "unknown": 1})
+    assert config.global_prefix == "djagger_"
+    assert not hasattr(config, "unknown")
+
+
+def test_djagger_config_types():
+
+    # Values of the wrong type are rejected instead of coerced
+
+    import pytest
+
+    with pytest.raises(TypeError):
+        DjaggerConfig(global_prefix=None)  # type: ignore
+
+    with pytest.raises(TypeError):
+        DjaggerConfig.parse_obj({"silence_unknown_kwargs": "false"})
+
+    config = DjaggerConfig.parse_obj({"silence_unknown_kwargs": True})
+    assert config.silence_unknown_kwargs is True
+    assert config.global_prefix == ""
+
+
+def test_djagger_config_malformed():
+
+    # A DJAGGER_CONFIG that is not a dict is rejected rather than ignored
+
+    import pytest
+    from django.test import override_settings
+
+    with pytest.raises(TypeError):
+        DjaggerConfig.parse_obj(["global_prefix"])  # type: ignore
+
+    get_djagger_config.cache_clear()
+    try:
+        with override_settings(DJAGGER_CONFIG=None):
+            with pytest.raises(TypeError):
+                get_djagger_config()
+    finally:
+        get_djagger_config.cache_clear()
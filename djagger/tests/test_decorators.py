@@ -1,3 +1,4 @@
+import warnings
 from ..decorators import schema
 from ..enums import DJAGGER_HTTP_METHODS
 
@@ -28,3 +29,32 @@ def test_schema_decorator_2():
         error = e
     
     assert error
+
+
+def test_schema_decorator_3():
+
+    # Test a single warning is emitted for unknown keywords
+
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter("always")
+
+        @schema(methods=["GET"], summary="summary", unknown_1=1, unknown_2=2)
+        def fbv():
+            return None
+
+    assert len(w) == 1
+    assert "unknown_1" in str(w[0].message)
+    assert not hasattr(fbv, "unknown_1")
+    assert fbv.summary == "summary"
+
+
+def test_schema_decorator_4():
+
+    # Test the decorator can also be applied to a class
+
+    @schema(methods=["GET"], summary="summary")
+    class View:
+        pass
+
+    assert View.summary == "summary"
+    assert getattr(View, DJAGGER_HTTP_METHODS) == ["GET"]
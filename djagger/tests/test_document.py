@@ -4,3 +4,108 @@ def test_document():
 
     document = Document.generate()
     assert document
+
+
+def test_document_tags():
+
+    from ..openapi import Document, Tag
+
+    document = Document.generate(
+        tags=[{"name": "tag1", "description": "Tag 1"}, Tag(name="tag2")]
+    )
+    assert [tag["name"] for tag in document["tags"]] == ["tag1", "tag2"]
+
+
+def test_document_json(monkeypatch):
+
+    import json
+    from django.core.serializers.json import DjangoJSONEncoder
+    from django.test import override_settings
+    from .. import openapi
+    from ..openapi import Document
+
+    with override_settings(ROOT_URLCONF="djagger.tests.urls"):
+
+        expected = json.loads(json.dumps(Document.generate(), cls=DjangoJSONEncoder))
+        example = expected["paths"]["/event"]["get"]["responses"]["200"]["content"][
+            "application/json"
+        ]["example"]
+        assert example == {"at": "2022-01-01T12:00:00.123"}
+
+        # Same output with orjson, when it is installed, and without it
+        assert json.loads(Document.generate_json()) == expected
+        monkeypatch.setattr(openapi, "orjson", None)
+        assert json.loads(Document.generate_json()) == expected
+
+
+def test_document_info():
+
+    from ..openapi import Document
+
+    document = Document.generate(contact_email="")
+    assert "contact" not in document["info"]
+    assert "license" not in document["info"]
+
+    document = Document.generate(license_name="MIT")
+    assert document["info"]["contact"] == {"email": "example@example.com", "url": ""}
+    assert document["info"]["license"] == {"name": "MIT", "url": ""}
+
+
+def test_document_iter_paths():
+
+    import gc
+    from django.test import override_settings
+    from ..openapi import Document, Operation
+    from ..utils import model_to_dict
+
+    def live_operations():
+        gc.collect()
+        return sum(type(obj) is Operation for obj in gc.get_objects())
+
+    with override_settings(ROOT_URLCONF="djagger.tests.urls"):
+
+        document = Document.generate()
+        assert set(document["paths"]) == {
+            "/item",
+            "/item/copy",
+            "/item/fbv",
+            "/event",
+            "/items/",
+            "/items/{pk}/",
+        }
+        del document
+
+        # Operations are released with each path once it is converted and dropped
+        baseline = live_operations()
+        paths = {}
+        for route, path in Document.iter_paths():
+            paths[route] = model_to_dict(path)
+            del path
+            assert live_operations() <= baseline + 2
+
+        assert paths == Document.generate()["paths"]
+
+
+def test_document_command(tmp_path, monkeypatch):
+
+    import json
+    from django.core.serializers.json import DjangoJSONEncoder
+    from django.test import override_settings
+    from .. import openapi
+    from ..openapi import Document
+    from ..management.commands.djagger_document import Command
+
+    with override_settings(ROOT_URLCONF="djagger.tests.urls"):
+
+        expected = json.loads(json.dumps(Document.generate(), cls=DjangoJSONEncoder))
+
+        # Written with orjson when it is installed
+        fname = tmp_path / "schema.json"
+        Command().handle(fname=str(fname))
+        assert json.loads(fname.read_text()) == expected
+
+        # Streamed with the standard library json module otherwise
+        monkeypatch.setattr(openapi, "orjson", None)
+        fname = tmp_path / "schema_stdlib.json"
+        Command().handle(fname=str(fname))
+        assert json.loads(fname.read_text()) == expected
@@ -20,3 +20,47 @@ def test_djagger_view_attributes():
 def test_view_attributes():
     """Test correct creation of ViewAttributes"""
     assert len(ViewAttributes.attr_list) > 0
+
+
+def test_djagger_view_attributes_enum_identity():
+    """Test generated attribute enums are reused for identical definitions"""
+
+    custom_prefix = "test_"
+    attrs_1 = DjaggerViewAttributes(custom_prefix, *HttpMethod.values())
+    attrs_2 = DjaggerViewAttributes(custom_prefix, *HttpMethod.values())
+
+    assert attrs_1.api is attrs_2.api
+    assert attrs_1.get is attrs_2.get
+    assert attrs_1.api is not ViewAttributes.api
+
+
+def test_retrieve_operation_attr_value():
+    """Test conversion of API-level attribute to the operation-level attribute"""
+
+    assert ViewAttributes.retrieve_operation_attr_value("summary", HttpMethod.GET) == "get_summary"
+
+    error = None
+    try:
+        ViewAttributes.retrieve_operation_attr_value("wrong", HttpMethod.GET)
+    except ValueError as e:
+        error = e
+
+    assert error
+
+
+def test_from_view():
+    """Test extraction of attributes from a view and its parent ``cls``"""
+
+    class View:
+        summary = "value1"
+        get_description = "value2"
+
+    def fbv():
+        ...
+
+    fbv.cls = View
+
+    assert ViewAttributes.from_view(fbv, "summary", HttpMethod.GET) == "value1"
+    assert ViewAttributes.from_view(fbv, "description", HttpMethod.GET) == "value2"
+    assert ViewAttributes.from_view(fbv, "description", HttpMethod.POST) is None
+    assert ViewAttributes.from_view(fbv, "summary") == "value1"
@@ -135,3 +135,16 @@ def test_choice_field():
         enum_values = schema_deref["properties"][field_name]["enum"]
 
         assert set(choice_values) == set(enum_values)
+
+
+def test_model_from():
+    class TestSerializer(serializers.Serializer):
+        pk = fields.IntegerField()
+
+    # Conversions are cached per serializer
+    model = SerializerConverter.model_from(TestSerializer)
+    assert model is SerializerConverter.model_from(TestSerializer)
+    assert model.schema() == SerializerConverter(s=TestSerializer()).to_model().schema()
+
+    many = TestSerializer(many=True)
+    assert SerializerConverter.model_from(many) is SerializerConverter.model_from(many)
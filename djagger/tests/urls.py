@@ -0,0 +1,95 @@
+# URLconf with documented views for testing document generation
+
+from datetime import datetime
+from django.http import JsonResponse
+from django.urls import re_path
+from pydantic import BaseModel
+from rest_framework import viewsets
+from rest_framework.response import Response
+from rest_framework.routers import SimpleRouter
+from rest_framework.views import APIView
+from typing import List
+from ..decorators import schema
+
+# Views in the ``djagger`` app are skipped when generating documents,
+# so the test views are presented as part of a separate app
+APP_MODULE = "testapp.views"
+
+
+class ItemSchema(BaseModel):
+    """Item"""
+
+    name: str
+
+
+class ItemView(APIView):
+    """Item API"""
+
+    response_schema = ItemSchema
+
+    def get(self, request):
+        return Response({})
+
+    def post(self, request):
+        return Response({})
+
+
+ItemView.__module__ = APP_MODULE
+
+
+class EventSchema(BaseModel):
+    """Event with a datetime in its example"""
+
+    at: datetime
+
+    @classmethod
+    def example(cls):
+        return cls(at=datetime(2022, 1, 1, 12, 0, 0, 123456))
+
+
+class EventView(APIView):
+    """Event API"""
+
+    response_schema = EventSchema
+
+    def get(self, request):
+        return Response({})
+
+
+EventView.__module__ = APP_MODULE
+
+
+@schema(methods=["GET"], summary="Item FBV", response_schema=ItemSchema)
+def item_fbv(request):
+    return JsonResponse({})
+
+
+item_fbv.__module__ = APP_MODULE
+
+
+class ItemViewSet(viewsets.ViewSet):
+    """Item ViewSet"""
+
+    response_schema = ItemSchema
+
+    def list(self, request):
+        return Response([])
+
+    def create(self, request):
+        return Response({})
+
+    def retrieve(self, request, pk=None):
+        return Response({})
+
+
+ItemViewSet.__module__ = APP_MODULE
+
+router = SimpleRouter()
+router.register("items", ItemViewSet, basename="items")
+
+urlpatterns: List = [
+    re_path(r"^item$", ItemView.as_view()),
+    re_path(r"^item/copy$", ItemView.as_view()),
+    re_path(r"^item/fbv$", item_fbv),
+    re_path(r"^event$", EventView.as_view()),
+] + router.urls
@@ -9,7 +9,8 @@ from django.urls import URLPattern, URLResolver, get_resolver
 from django.urls.resolvers import RegexPattern, RoutePattern, _route_to_regex
 from rest_framework import fields, serializers
 from typing import List, Type, Callable, Any
-from pydantic import create_model
+from pydantic import BaseModel, create_model
+from pydantic.utils import ROOT_KEY
 from pydantic.main import ModelMetaclass, ModelField
 from pydantic.fields import UndefinedType
 from pydantic.schema import get_flat_models_from_model, get_model_name_map, field_schema
@@ -18,7 +19,6 @@ from decimal import Decimal
 from enum import Enum
 import warnings
 import re
-import uuid
 
 
 def get_app_name(module: str) -> str:
@@ -376,17 +376,31 @@ def model_field_schemas(
     return schemas
 
 
-# def extract_unique_schema(model : ModelMetaclass) -> dict:
-#     """ Calls the ``.schema()`` method with a custom ``ref_template`` containing uuid4.
-#     This ensures the generated schema object definition will be unique across all other objects
-#     if there are duplicate model names (e.g., imported from other modules)
-#     """
-#     suffix = uuid.uuid4().hex
-#     schema = model.schema(ref_template='#/definitions/{model}' + '-' + suffix)
-#     definitions = schema.get('definitions', {})
-
-#     # Change all keys in definitions to have the suffix as well so the $ref will be valid.
-#     if definitions:
-#         schema['definitions'] = { k + '-' + suffix : v for k,v in definitions.items() }
+def model_to_dict(value: Any) -> Any:
+    """Recursively converts pydantic models into dicts keyed by field alias, omitting fields with ``None`` values.
+    Equivalent to ``model.dict(by_alias=True, exclude_none=True)`` but without pydantic's include / exclude bookkeeping.
+    Dicts, lists and tuples are walked so that nested models are converted as well.
+    """
+    if isinstance(value, BaseModel):
+        fields = value.__fields__
+        result = {
+            (fields[k].alias if k in fields else k): model_to_dict(v)
+            for k, v in value.__dict__.items()
+            if v is not None
+        }
+        if ROOT_KEY in result:
+            return result[ROOT_KEY]
+        return result
+
+    if isinstance(value, dict):
+        return {k: model_to_dict(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        items = (model_to_dict(v) for v in value)
+        if hasattr(value, "_fields"):
+            # namedtuples take their items as positional arguments, as in pydantic
+            return value.__class__(*items)
+        return value.__class__(items)
+
+    return value
 
-#     return schema
@@ -1,5 +1,5 @@
 from django.shortcuts import render
-from django.http import JsonResponse, HttpRequest
+from django.http import HttpResponse, HttpRequest
 from django.conf import settings
 from django.urls import reverse
 
@@ -14,9 +14,9 @@ def open_api_json(request: HttpRequest):
     """View for auto generated OpenAPI JSON document"""
 
     doc_settings = getattr(settings, "DJAGGER_DOCUMENT", {})
-    document = Document.generate(**doc_settings)
+    document = Document.generate_json(**doc_settings)
 
-    response = JsonResponse(document)
+    response = HttpResponse(document, content_type="application/json")
     response["Cache-Control"] = "no-cache, no-store, must-revalidate"
 
     return response